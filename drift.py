@@ -0,0 +1,115 @@
+import threading
+
+import numpy as np
+import pandas as pd
+
+# Ambang batas PSI yang umum dipakai
+PSI_WARNING = 0.1
+PSI_ALERT = 0.25
+# Jumlah prediksi minimum (bobot efektif) sebelum status drift dinilai
+MIN_SAMPLES = 30
+# Bobot prediksi berkurang setengahnya setelah sekian prediksi berikutnya
+HALF_LIFE = 500
+
+
+def population_stability_index(expected, actual, eps=1e-4):
+    """PSI antara dua histogram (jumlah per bin dengan batas bin yang sama)."""
+    p = np.asarray(expected, dtype=float)
+    q = np.asarray(actual, dtype=float)
+    p = np.clip(p / max(p.sum(), 1), eps, None)
+    q = np.clip(q / max(q.sum(), 1), eps, None)
+    return float(np.sum((q - p) * np.log(q / p)))
+
+
+def ks_statistic(expected, actual):
+    """Statistik KS (selisih maksimum CDF) yang dihitung dari histogram."""
+    p = np.cumsum(expected) / max(np.sum(expected), 1)
+    q = np.cumsum(actual) / max(np.sum(actual), 1)
+    return float(np.max(np.abs(p - q)))
+
+
+class DriftMonitor:
+    """Histogram streaming per fitur yang dibandingkan dengan distribusi referensi.
+
+    Batas bin diambil dari kuantil data referensi, sehingga memori tetap
+    konstan (satu array jumlah per fitur) berapa pun banyaknya prediksi.
+    Jumlah per bin meluruh secara eksponensial (`half_life` prediksi) agar
+    histogram menggambarkan prediksi terbaru, bukan seluruh riwayat.
+    """
+
+    def __init__(self, reference, bins=10, half_life=HALF_LIFE):
+        self.names = list(reference.keys())
+        self.edges = {}
+        self.reference_counts = {}
+        self.counts = {}
+        for name, values in reference.items():
+            values = np.asarray(values, dtype=float)
+            quantiles = np.quantile(values, np.linspace(0, 1, bins + 1)[1:-1])
+            self.edges[name] = np.unique(quantiles)
+            self.reference_counts[name] = self._histogram(name, values)
+            self.counts[name] = np.zeros(len(self.reference_counts[name]), dtype=float)
+        self.decay = 0.5 ** (1 / half_life)
+        self.n = 0
+        self._lock = threading.Lock()
+
+    def _histogram(self, name, values):
+        idx = np.searchsorted(self.edges[name], values, side='right')
+        return np.bincount(idx, minlength=len(self.edges[name]) + 1)
+
+    def update(self, batch):
+        """Tambahkan satu batch nilai; `batch` berisi nama -> array nilai."""
+        hists = {name: self._histogram(name, np.asarray(values, dtype=float).ravel())
+                 for name, values in batch.items() if name in self.edges}
+        size = max((len(np.atleast_1d(v)) for v in batch.values()), default=0)
+        weight = self.decay ** size
+        with self._lock:
+            for name in self.names:
+                self.counts[name] *= weight
+            for name, hist in hists.items():
+                self.counts[name] += hist
+            self.n += size
+
+    def reset(self):
+        with self._lock:
+            for name in self.names:
+                self.counts[name][:] = 0
+            self.n = 0
+
+    def distribution(self, name):
+        """Proporsi per bin untuk referensi dan prediksi terbaru."""
+        with self._lock:
+            current = self.counts[name].copy()
+        edges = self.edges[name]
+        labels = [f"< {edges[0]:.4g}"] if len(edges) else ["Semua"]
+        labels += [f"{lo:.4g} - {hi:.4g}" for lo, hi in zip(edges[:-1], edges[1:])]
+        if len(edges):
+            labels.append(f"≥ {edges[-1]:.4g}")
+        reference = self.reference_counts[name]
+        return pd.DataFrame({
+            'Bin': labels,
+            'Referensi': reference / max(reference.sum(), 1),
+            'Terbaru': current / max(current.sum(), 1)
+        })
+
+    def report(self):
+        """PSI, KS dan status drift untuk setiap fitur."""
+        with self._lock:
+            counts = {name: self.counts[name].copy() for name in self.names}
+        rows = []
+        for name in self.names:
+            current = counts[name]
+            psi = population_stability_index(self.reference_counts[name], current)
+            ks = ks_statistic(self.reference_counts[name], current)
+            if current.sum() < MIN_SAMPLES:
+                # PSI dari histogram yang hampir kosong tidak bermakna
+                psi = ks = float('nan')
+                status = 'Data kurang'
+            elif psi >= PSI_ALERT:
+                status = 'Drift signifikan'
+            elif psi >= PSI_WARNING:
+                status = 'Drift sedang'
+            else:
+                status = 'Stabil'
+            rows.append({'Fitur': name, 'Jumlah Efektif': round(float(current.sum()), 1),
+                         'PSI': round(psi, 4), 'KS': round(ks, 4), 'Status': status})
+        return pd.DataFrame(rows)
@@ -0,0 +1,316 @@
+"""Uji beban lokal untuk stream_diabetes.py.
+
+Mensimulasikan banyak sesi Streamlit secara bersamaan dengan AppTest (tanpa
+browser maupun jaringan) dan klien scoring yang memanggil score_batch secara
+langsung. Hasilnya berupa persentil latensi, throughput dan memori per sesi.
+
+AppTest memasang Runtime global di setiap run sehingga dua run dalam satu
+proses tidak bisa berjalan bersamaan. Karena itu setiap sesi (dan setiap klien
+scoring) dijalankan di proses worker sendiri; semua worker dipanaskan dulu lalu
+dilepas bersamaan. Batasan: cache_resource (model, dataset referensi, log
+prediksi, monitor drift) tidak dibagi antar sesi seperti pada satu server
+Streamlit, dan memori per sesi adalah kenaikan RSS tiap worker setelah
+pemanasan, dijumlahkan lalu dirata-rata.
+
+Contoh:
+    python loadtest.py --sessions 8 --iterations 20 --mix prediksi=5,filter=3,scatter=2
+"""
+import argparse
+import gc
+import json
+import logging
+import multiprocessing
+import os
+import pickle
+import random
+import time
+import warnings
+from collections import defaultdict
+
+import numpy as np
+
+APP_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "stream_diabetes.py")
+
+PAGE_PREDIKSI = "📊 Prediksi"
+PAGE_ANALISIS = "📈 Analisis"
+PAGE_DATA = "📋 Data"
+ACTION_PAGES = {'prediksi': PAGE_PREDIKSI, 'filter': PAGE_DATA, 'scatter': PAGE_ANALISIS}
+# Hasil prediksi positif ditampilkan dengan st.error, jadi bukan tanda kegagalan
+RESULT_BANNER = "## ⚠️ **HASIL:"
+SCATTER_AXES = ['Kehamilan', 'Glukosa', 'Tekanan Darah', 'Ketebalan Kulit',
+                'Insulin', 'BMI', 'Riwayat Diabetes', 'Usia']
+
+
+def rss_bytes():
+    """Resident set size proses saat ini (Linux)."""
+    with open("/proc/self/statm") as f:
+        return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+
+
+def parse_mix(text):
+    mix = {}
+    for item in text.split(","):
+        name, _, weight = item.partition("=")
+        name = name.strip()
+        if name not in ACTION_PAGES:
+            raise argparse.ArgumentTypeError(f"aksi tidak dikenal: {name}")
+        mix[name] = float(weight or 1)
+    return mix
+
+
+class Recorder:
+    """Kumpulan latensi per aksi."""
+
+    def __init__(self):
+        self.latencies = defaultdict(list)
+        self.errors = defaultdict(int)
+
+    def record(self, action, seconds, ok=True):
+        self.latencies[action].append(seconds)
+        if not ok:
+            self.errors[action] += 1
+
+    def merge(self, latencies, errors):
+        """Gabungkan hasil dari worker lain."""
+        for action, values in latencies.items():
+            self.latencies[action].extend(values)
+        for action, count in errors.items():
+            self.errors[action] += count
+
+
+def page_failed(at):
+    """Exception yang tidak tertangani atau st.error dari blok except aplikasi."""
+    if at.exception:
+        return True
+    return any(not str(e.value).startswith(RESULT_BANNER) for e in at.error)
+
+
+def timed_run(recorder, action, at, timeout):
+    start = time.perf_counter()
+    try:
+        at.run(timeout=timeout)
+        ok = not page_failed(at)
+    except Exception:
+        ok = False
+    recorder.record(action, time.perf_counter() - start, ok)
+
+
+def warm_up(timeout):
+    """Muat setiap halaman sekali agar impor modul dan cache_resource terisi
+    sebelum memori awal diukur."""
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(APP_FILE, default_timeout=timeout).run()
+    for page in (PAGE_DATA, PAGE_ANALISIS, PAGE_PREDIKSI):
+        at.sidebar.radio[0].set_value(page).run(timeout=timeout)
+    at.button(key="prediksi_button").click().run(timeout=timeout)
+
+
+def session_worker(session_no, args, recorder):
+    """Jalankan satu sesi; AppTest dikembalikan agar memorinya ikut terukur."""
+    from streamlit.testing.v1 import AppTest
+
+    rng = random.Random(args.seed + session_no)
+    actions, weights = zip(*args.mix.items())
+    at = AppTest.from_file(APP_FILE, default_timeout=args.timeout)
+    timed_run(recorder, 'muat', at, args.timeout)
+    page = None
+
+    for _ in range(args.iterations):
+        action = rng.choices(actions, weights)[0]
+        if page != ACTION_PAGES[action]:
+            try:
+                at.sidebar.radio[0].set_value(ACTION_PAGES[action])
+            except Exception:
+                # Sidebar tidak ada (run sebelumnya gagal); muat ulang sesi
+                recorder.record('navigasi', 0.0, ok=False)
+                timed_run(recorder, 'muat', at, args.timeout)
+                page = None
+                continue
+            page = ACTION_PAGES[action]
+            timed_run(recorder, 'navigasi', at, args.timeout)
+
+        try:
+            if action == 'prediksi':
+                at.number_input(key="glukosa_input").set_value(rng.randint(70, 200))
+                at.button(key="prediksi_button").click()
+            elif action == 'filter':
+                at.slider(key=rng.choice(["filter_age", "filter_glucose"])).set_value(
+                    rng.randint(21, 60) if rng.random() < 0.5 else rng.randint(60, 150))
+            else:
+                at.selectbox(key=rng.choice(["x_axis", "y_axis"])).set_value(rng.choice(SCATTER_AXES))
+        except Exception:
+            # Widget tidak ditemukan (misalnya halaman gagal dimuat)
+            recorder.record(action, 0.0, ok=False)
+            continue
+        timed_run(recorder, action, at, args.timeout)
+
+        if args.think_time:
+            time.sleep(rng.uniform(0, args.think_time))
+    return at
+
+
+def api_worker(client_no, args, recorder, model, reference):
+    from reports import score_batch
+
+    rng = np.random.default_rng(args.seed + 10_000 + client_no)
+    for _ in range(args.iterations):
+        batch = reference.raw.iloc[rng.integers(0, len(reference.raw), args.batch_size)]
+        start = time.perf_counter()
+        try:
+            score_batch(batch, model, reference.imputer)
+            ok = True
+        except Exception:
+            ok = False
+        recorder.record('api', time.perf_counter() - start, ok)
+
+
+def load_scoring():
+    from store import build_reference
+
+    with open("diabetes_model.sav", "rb") as f:
+        model = pickle.load(f)
+    return model, build_reference("diabetes.csv")
+
+
+def worker_process(kind, no, args, barrier, results):
+    """Satu sesi (`kind` 'sesi') atau klien scoring ('api') dalam proses sendiri.
+
+    Biaya satu kali (impor, model, dataset) dibayar sebelum barrier sehingga
+    tidak ikut dalam latensi maupun memori per sesi.
+    """
+    # AppTest mencetak banyak peringatan yang tidak relevan untuk pengukuran
+    warnings.filterwarnings("ignore")
+    from streamlit.logger import set_log_level
+    set_log_level(logging.ERROR)
+    # Jalankan aplikasi dari foldernya agar berkas model dan dataset ditemukan
+    os.chdir(os.path.dirname(APP_FILE))
+
+    recorder = Recorder()
+    ready = True
+    try:
+        if kind == 'sesi':
+            warm_up(args.timeout)
+        else:
+            model, reference = load_scoring()
+    except Exception:
+        recorder.record('pemanasan', 0.0, ok=False)
+        ready = False
+    gc.collect()
+    rss_start = rss_bytes()
+
+    barrier.wait()
+    at = None
+    if ready:
+        try:
+            if kind == 'sesi':
+                at = session_worker(no, args, recorder)
+            else:
+                api_worker(no, args, recorder, model, reference)
+        except Exception:
+            recorder.record(kind, 0.0, ok=False)
+    gc.collect()
+    results.put({
+        'kind': kind,
+        'latencies': dict(recorder.latencies),
+        'errors': dict(recorder.errors),
+        'rss_start': rss_start,
+        'rss_end': rss_bytes()
+    })
+    del at
+
+
+def summarize(recorder, wall_time, memory):
+    rows = []
+    total = 0
+    for action, values in sorted(recorder.latencies.items()):
+        ms = np.asarray(values) * 1000
+        total += len(ms)
+        rows.append({
+            'aksi': action,
+            'jumlah': len(ms),
+            'error': recorder.errors[action],
+            'p50_ms': round(float(np.percentile(ms, 50)), 1),
+            'p90_ms': round(float(np.percentile(ms, 90)), 1),
+            'p99_ms': round(float(np.percentile(ms, 99)), 1),
+            'max_ms': round(float(ms.max()), 1),
+            'throughput_per_s': round(len(ms) / wall_time, 2)
+        })
+    return {
+        'durasi_s': round(wall_time, 2),
+        'total_permintaan': total,
+        'throughput_per_s': round(total / wall_time, 2),
+        'aksi': rows,
+        'memori': memory
+    }
+
+
+def print_report(report):
+    header = f"{'aksi':<10}{'jumlah':>8}{'error':>7}{'p50 ms':>10}{'p90 ms':>10}{'p99 ms':>10}{'max ms':>10}{'req/s':>9}"
+    print(header)
+    print("-" * len(header))
+    for row in report['aksi']:
+        print(f"{row['aksi']:<10}{row['jumlah']:>8}{row['error']:>7}{row['p50_ms']:>10}"
+              f"{row['p90_ms']:>10}{row['p99_ms']:>10}{row['max_ms']:>10}{row['throughput_per_s']:>9}")
+    print("-" * len(header))
+    print(f"Durasi: {report['durasi_s']} s, total permintaan: {report['total_permintaan']}, "
+          f"throughput: {report['throughput_per_s']} req/s")
+    memory = report['memori']
+    print(f"Memori worker sesi (jumlah, setelah pemanasan): awal {memory['rss_awal_mb']} MB, "
+          f"akhir {memory['rss_akhir_mb']} MB, per sesi ~{memory['per_sesi_mb']} MB")
+    print("Catatan: setiap sesi berjalan di proses sendiri, sehingga cache_resource tidak dibagi "
+          "antar sesi seperti pada satu server Streamlit.")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Uji beban lokal aplikasi Prediksi Diabetes")
+    parser.add_argument("--sessions", type=int, default=4, help="jumlah sesi Streamlit bersamaan")
+    parser.add_argument("--api-clients", type=int, default=0, help="jumlah klien scoring bersamaan")
+    parser.add_argument("--iterations", type=int, default=10, help="aksi per sesi / klien")
+    parser.add_argument("--mix", type=parse_mix, default=parse_mix("prediksi=5,filter=3,scatter=2"),
+                        help="bobot aksi, misalnya prediksi=5,filter=3,scatter=2")
+    parser.add_argument("--batch-size", type=int, default=100, help="jumlah pasien per permintaan scoring")
+    parser.add_argument("--think-time", type=float, default=0.0, help="jeda acak maksimum antar aksi (detik)")
+    parser.add_argument("--timeout", type=float, default=60.0, help="batas waktu satu run AppTest (detik)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", action="store_true", help="cetak hasil sebagai JSON")
+    args = parser.parse_args(argv)
+
+    # Proses baru (spawn) agar setiap worker memulai Streamlit dari keadaan bersih
+    ctx = multiprocessing.get_context("spawn")
+    workers = [('sesi', i) for i in range(args.sessions)] + [('api', i) for i in range(args.api_clients)]
+    barrier = ctx.Barrier(len(workers) + 1)
+    results = ctx.Queue()
+    processes = [ctx.Process(target=worker_process, args=(kind, no, args, barrier, results))
+                 for kind, no in workers]
+    for process in processes:
+        process.start()
+
+    # Semua worker sudah dipanaskan; ukur dari saat mereka dilepas bersamaan
+    barrier.wait()
+    start = time.perf_counter()
+    outputs = [results.get() for _ in processes]
+    wall_time = time.perf_counter() - start
+    for process in processes:
+        process.join()
+
+    recorder = Recorder()
+    for output in outputs:
+        recorder.merge(output['latencies'], output['errors'])
+    sessions = [output for output in outputs if output['kind'] == 'sesi']
+    rss_start = sum(output['rss_start'] for output in sessions)
+    rss_end = sum(output['rss_end'] for output in sessions)
+    memory = {
+        'rss_awal_mb': round(rss_start / 2**20, 1),
+        'rss_akhir_mb': round(rss_end / 2**20, 1),
+        'per_sesi_mb': round((rss_end - rss_start) / 2**20 / max(len(sessions), 1), 2)
+    }
+    report = summarize(recorder, wall_time, memory)
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report)
+
+
+if __name__ == "__main__":
+    main()
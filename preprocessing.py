@@ -0,0 +1,76 @@
+import numpy as np
+import pandas as pd
+
+# Urutan kolom fitur sesuai urutan input model
+FEATURE_COLUMNS = ['Pregnancies', 'Glucose', 'BloodPressure', 'SkinThickness',
+                   'Insulin', 'BMI', 'DiabetesPedigreeFunction', 'Age']
+TARGET_COLUMN = 'Outcome'
+
+# Kolom yang menyimpan nilai hilang sebagai 0 pada diabetes.csv (sel kosong/NaN
+# pada berkas unggahan juga dianggap hilang)
+ZERO_MISSING_COLUMNS = ['Glucose', 'BloodPressure', 'SkinThickness', 'Insulin', 'BMI']
+ZERO_MISSING_INDEX = np.array([FEATURE_COLUMNS.index(c) for c in ZERO_MISSING_COLUMNS])
+
+
+def detect_missing(df):
+    """Mask boolean nilai hilang (0 atau NaN) untuk kolom ZERO_MISSING_COLUMNS."""
+    values = df[ZERO_MISSING_COLUMNS]
+    return values.isna() | values.eq(0)
+
+
+def mask_missing(df):
+    """Salinan `df` dengan nilai hilang (0 atau NaN) diganti NaN."""
+    result = df.copy()
+    result[ZERO_MISSING_COLUMNS] = result[ZERO_MISSING_COLUMNS].mask(detect_missing(df))
+    return result
+
+
+def missing_report(df):
+    """Jumlah dan persentase nilai hilang per kolom."""
+    counts = detect_missing(df).sum()
+    return pd.DataFrame({
+        'Kolom': counts.index,
+        'Jumlah Hilang': counts.values,
+        'Persentase (%)': (counts.values / max(len(df), 1) * 100).round(1)
+    })
+
+
+def fit_imputer(df):
+    """Hitung median kolom (global dan per Outcome) dari nilai yang tidak hilang."""
+    values = mask_missing(df)[ZERO_MISSING_COLUMNS]
+    imputer = {'global': values.median()}
+    if TARGET_COLUMN in df.columns:
+        imputer['by_outcome'] = values.groupby(df[TARGET_COLUMN]).median()
+    return imputer
+
+
+def impute(df, imputer=None):
+    """Isi nilai hilang secara tervektorisasi.
+
+    Jika kolom Outcome tersedia, nilai diisi dengan median per Outcome;
+    sisanya (atau bila Outcome tidak ada) diisi dengan median global.
+    """
+    if imputer is None:
+        imputer = fit_imputer(df)
+    result = df.copy()
+    values = result[ZERO_MISSING_COLUMNS].mask(detect_missing(result))
+    if TARGET_COLUMN in result.columns and 'by_outcome' in imputer:
+        by_outcome = imputer['by_outcome'].reindex(result[TARGET_COLUMN].to_numpy())
+        values = values.fillna(pd.DataFrame(by_outcome.to_numpy(), index=values.index,
+                                            columns=ZERO_MISSING_COLUMNS))
+    result[ZERO_MISSING_COLUMNS] = values.fillna(imputer['global'])
+    return result
+
+
+def impute_array(X, imputer):
+    """Versi numpy dari impute() untuk input model (urutan FEATURE_COLUMNS).
+
+    Outcome belum diketahui saat prediksi sehingga hanya median global yang dipakai.
+    Mengembalikan array hasil imputasi dan mask nilai yang diisi.
+    """
+    X = np.asarray(X, dtype=float).copy()
+    subset = X[:, ZERO_MISSING_INDEX]
+    mask = (subset == 0) | np.isnan(subset)
+    medians = imputer['global'][ZERO_MISSING_COLUMNS].to_numpy(dtype=float)
+    X[:, ZERO_MISSING_INDEX] = np.where(mask, medians, subset)
+    return X, mask
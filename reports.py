@@ -0,0 +1,283 @@
+import csv
+import io
+import zipfile
+from datetime import datetime
+from html import escape
+from string import Template
+
+import numpy as np
+import pandas as pd
+
+from preprocessing import FEATURE_COLUMNS, ZERO_MISSING_COLUMNS, ZERO_MISSING_INDEX, detect_missing, impute_array
+
+MODEL_NAME = "Support Vector Machine (SVM)"
+
+# (label, satuan, bilangan bulat?) sesuai urutan FEATURE_COLUMNS
+PARAMETERS = [
+    ('Kehamilan', '', True),
+    ('Glukosa', 'mg/dL', True),
+    ('Tekanan Darah', 'mm Hg', True),
+    ('Ketebalan Kulit', 'mm', True),
+    ('Insulin', 'mu U/ml', True),
+    ('BMI', '', False),
+    ('Riwayat Diabetes', '', False),
+    ('Usia', 'tahun', True),
+]
+PARAMETER_LABELS = [label for label, _, _ in PARAMETERS]
+# Indeks parameter -> posisi pesannya pada analisis_parameter()['pesan']
+PESAN_INDEX = {1: 0, 5: 1, 2: 2, 7: 3, 4: 4}
+
+
+def parameter_values(data):
+    """Ubah 8 nilai mentah ke tipe yang sesuai (int/float) untuk ditampilkan.
+
+    Nilai bukan bilangan bulat (misalnya 148.7 dari berkas unggahan) tetap float.
+    """
+    return [int(v) if is_int and float(v).is_integer() else float(v) for v, (_, _, is_int) in zip(data, PARAMETERS)]
+
+
+def missing_flags(data):
+    """Mask 8 parameter yang nilainya hilang (0 atau NaN pada ZERO_MISSING_COLUMNS)."""
+    values = np.asarray(data, dtype=float)
+    flags = np.zeros(len(FEATURE_COLUMNS), dtype=bool)
+    subset = values[ZERO_MISSING_INDEX]
+    flags[ZERO_MISSING_INDEX] = (subset == 0) | np.isnan(subset)
+    return flags
+
+
+def analisis_parameter(data, imputed=None):
+    """Status, kategori dan pesan analisis untuk 8 parameter pasien.
+
+    `pesan` berisi pasangan (kelas CSS, pesan) untuk glukosa, BMI,
+    tekanan darah, usia dan insulin. Parameter yang nilainya hilang tidak
+    dinilai; bila `imputed` (8 nilai setelah imputasi) diberikan, median
+    pengganti yang dipakai model ikut ditampilkan.
+    """
+    (kehamilan, glukosa, tekanan_darah, ketebalan_kulit,
+     insulin, bmi, riwayat_diabetes, usia) = parameter_values(data)
+    status = ['Normal'] * 8
+    kategori = ['Normal'] * 8
+
+    # Analisis Glukosa
+    if glukosa >= 126:
+        status[1], kategori[1] = 'danger', 'Tinggi (≥126 mg/dL)'
+        glukosa_pesan = ("param-danger", f"❌ **Glukosa tinggi** ({glukosa} mg/dL) - Di atas batas diabetes (≥126 mg/dL)")
+    elif glukosa >= 100:
+        status[1], kategori[1] = 'warning', 'Pra-diabetes (100-125 mg/dL)'
+        glukosa_pesan = ("param-warning", f"⚠️ **Glukosa perbatasan** ({glukosa} mg/dL) - Pra-diabetes")
+    else:
+        status[1], kategori[1] = 'good', 'Normal (<100 mg/dL)'
+        glukosa_pesan = ("param-good", f"✅ **Glukosa normal** ({glukosa} mg/dL)")
+
+    # Analisis BMI
+    if bmi >= 30:
+        status[5], kategori[5] = 'danger', 'Obesitas (≥30)'
+        bmi_pesan = ("param-danger", f"❌ **BMI obesitas** ({bmi}) - Faktor risiko tinggi")
+    elif bmi >= 25:
+        status[5], kategori[5] = 'warning', 'Overweight (25-29.9)'
+        bmi_pesan = ("param-warning", f"⚠️ **BMI overweight** ({bmi}) - Perlu penurunan berat badan")
+    else:
+        status[5], kategori[5] = 'good', 'Normal (18.5-24.9)'
+        bmi_pesan = ("param-good", f"✅ **BMI normal** ({bmi})")
+
+    # Analisis Tekanan Darah
+    if tekanan_darah >= 140:
+        status[2], kategori[2] = 'danger', 'Hipertensi (≥140 mmHg)'
+        tekanan_pesan = ("param-danger", f"❌ **Tekanan darah tinggi** ({tekanan_darah} mmHg) - Hipertensi")
+    elif tekanan_darah >= 130:
+        status[2], kategori[2] = 'warning', 'Pra-hipertensi (130-139 mmHg)'
+        tekanan_pesan = ("param-warning", f"⚠️ **Tekanan darah perbatasan** ({tekanan_darah} mmHg) - Perlu pemantauan")
+    else:
+        status[2], kategori[2] = 'good', 'Normal (<130 mmHg)'
+        tekanan_pesan = ("param-good", f"✅ **Tekanan darah normal** ({tekanan_darah} mmHg)")
+
+    # Analisis Usia
+    if usia >= 45:
+        status[7], kategori[7] = 'warning', 'Risiko Tinggi (≥45 tahun)'
+        usia_pesan = ("param-warning", f"⚠️ **Usia ≥45 tahun** ({usia} tahun) - Faktor risiko diabetes meningkat")
+    else:
+        status[7], kategori[7] = 'good', 'Normal (<45 tahun)'
+        usia_pesan = ("param-good", f"✅ **Usia <45 tahun** ({usia} tahun) - Risiko lebih rendah")
+
+    # Analisis Insulin
+    if insulin > 100:
+        status[4], kategori[4] = 'warning', 'Tinggi (>100 μU/mL)'
+        insulin_pesan = ("param-warning", f"⚠️ **Insulin tinggi** ({insulin} μU/mL) - Kemungkinan resistensi insulin")
+    elif insulin < 25:
+        status[4], kategori[4] = 'warning', 'Rendah (<25 μU/mL)'
+        insulin_pesan = ("param-warning", f"⚠️ **Insulin rendah** ({insulin} μU/mL) - Perlu evaluasi fungsi pankreas")
+    else:
+        status[4], kategori[4] = 'good', 'Normal (25-100 μU/mL)'
+        insulin_pesan = ("param-good", f"✅ **Insulin normal** ({insulin} μU/mL)")
+
+    pesan = [glukosa_pesan, bmi_pesan, tekanan_pesan, usia_pesan, insulin_pesan]
+
+    # Nilai hilang bukan hasil pengukuran, jadi tidak diberi penilaian klinis
+    pengganti = parameter_values(imputed) if imputed is not None else None
+    for i in np.flatnonzero(missing_flags(data)):
+        label, unit, _ = PARAMETERS[i]
+        if pengganti is None:
+            diisi = "diisi median dataset"
+        else:
+            diisi = f"diisi median {pengganti[i]}" + (f" {unit}" if unit else "")
+        status[i], kategori[i] = 'missing', f"Tidak tersedia ({diisi})"
+        if i in PESAN_INDEX:
+            pesan[PESAN_INDEX[i]] = ("param-missing", f"❔ **{label} tidak tersedia** - Nilai kosong/0, {diisi} untuk prediksi")
+
+    return {
+        'status': status,
+        'kategori': kategori,
+        'pesan': pesan
+    }
+
+
+# ==================== TEMPLATE LAPORAN ====================
+TXT_TEMPLATE = Template("""HASIL PREDIKSI DIABETES
+Tanggal: $tanggal
+Model yang digunakan: $model
+Tingkat Keyakinan: $confidence
+
+DATA PASIEN:
+$data_pasien
+
+HASIL: $hasil
+
+ANALISIS PARAMETER:
+$analisis
+
+Catatan: Hasil ini merupakan prediksi berdasarkan model AI (SVM Classifier).
+Konsultasi dengan dokter tetap diperlukan untuk diagnosis pasti.
+""")
+
+HTML_TEMPLATE = Template("""<!DOCTYPE html>
+<html lang="id">
+<head><meta charset="utf-8"><title>Hasil Prediksi Diabetes</title></head>
+<body>
+<h1>Hasil Prediksi Diabetes</h1>
+<p>Tanggal: $tanggal<br>Model yang digunakan: $model<br>Tingkat Keyakinan: $confidence</p>
+<h2>$hasil</h2>
+<table border="1" cellpadding="4">
+<tr><th>Parameter</th><th>Nilai</th><th>Kategori</th></tr>
+$rows
+</table>
+<h3>Analisis Parameter</h3>
+<ol>
+$analisis
+</ol>
+<p><em>Hasil ini merupakan prediksi berdasarkan model AI (SVM Classifier).
+Konsultasi dengan dokter tetap diperlukan untuk diagnosis pasti.</em></p>
+</body>
+</html>
+""")
+
+HTML_ROW_TEMPLATE = Template("<tr><td>$parameter</td><td>$nilai</td><td>$kategori</td></tr>")
+
+
+def _label_hasil(hasil):
+    return 'RISIKO DIABETES TINGGI' if hasil == 1 else 'RISIKO DIABETES RENDAH'
+
+
+def _common_fields(record):
+    waktu = record.get('waktu') or datetime.now()
+    return {
+        'tanggal': waktu.strftime("%d/%m/%Y %H:%M"),
+        'model': MODEL_NAME,
+        'confidence': f"{record['confidence']:.1f}%",
+        'hasil': _label_hasil(record['hasil'])
+    }
+
+
+def render_txt(record):
+    """Laporan teks dari record prediksi (data, hasil, confidence, waktu, dan opsional imputed)."""
+    values = parameter_values(record['data'])
+    analisis = analisis_parameter(values, record.get('imputed'))
+    data_pasien = "\n".join(
+        f"- {label}: {value}" + (f" {unit}" if unit else "")
+        for value, (label, unit, _) in zip(values, PARAMETERS)
+    )
+    return TXT_TEMPLATE.substitute(
+        _common_fields(record),
+        data_pasien=data_pasien,
+        analisis="\n".join(f"{i}. {msg}" for i, (_, msg) in enumerate(analisis['pesan'], 1))
+    )
+
+
+def render_csv(record):
+    """Tabel parameter (Parameter, Nilai, Kategori) dalam format CSV."""
+    values = parameter_values(record['data'])
+    analisis = analisis_parameter(values, record.get('imputed'))
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    writer.writerow(['Parameter', 'Nilai', 'Kategori'])
+    writer.writerows(zip(PARAMETER_LABELS, values, analisis['kategori']))
+    return buffer.getvalue()
+
+
+def render_html(record):
+    """Laporan HTML mandiri untuk satu pasien."""
+    values = parameter_values(record['data'])
+    analisis = analisis_parameter(values, record.get('imputed'))
+    rows = "\n".join(
+        HTML_ROW_TEMPLATE.substitute(parameter=escape(label), nilai=value, kategori=escape(kategori))
+        for label, value, kategori in zip(PARAMETER_LABELS, values, analisis['kategori'])
+    )
+    return HTML_TEMPLATE.substitute(
+        _common_fields(record),
+        rows=rows,
+        analisis="\n".join(f"<li>{escape(msg.replace('**', ''))}</li>" for _, msg in analisis['pesan'])
+    )
+
+
+RENDERERS = {'txt': render_txt, 'csv': render_csv, 'html': render_html}
+
+
+# ==================== PREDIKSI & LAPORAN BATCH ====================
+def score_batch(df, model, imputer=None):
+    """Prediksi seluruh baris `df` sekaligus; menambah kolom Hasil, Confidence (dan DecisionScore).
+
+    Bila `imputer` diberikan, kolom Nilai Diisi mencatat kolom yang diisi median.
+    """
+    X = df[FEATURE_COLUMNS].to_numpy(dtype=float)
+    if imputer is not None:
+        X, _ = impute_array(X, imputer)
+    result = df[FEATURE_COLUMNS].copy()
+    result['Hasil'] = model.predict(X).astype(int)
+    if hasattr(model, 'decision_function'):
+        result['DecisionScore'] = model.decision_function(X)
+        result['Confidence'] = np.clip(50 + result['DecisionScore'] * 10, 0, 100)
+    else:
+        result['Confidence'] = 85.0
+    if imputer is not None:
+        missing = detect_missing(df)
+        result['Nilai Diisi'] = missing.dot(pd.Index(ZERO_MISSING_COLUMNS) + ', ').str.rstrip(', ')
+    return result
+
+
+def write_reports_zip(fileobj, scored, formats=('txt', 'csv', 'html'), waktu=None, imputer=None):
+    """Tulis laporan per pasien ke arsip zip, satu berkas per pasien per format.
+
+    Laporan dibuat dan dikompresi satu per satu ke `fileobj`, sehingga teks
+    laporan tidak pernah terkumpul semuanya. Ringkasan hasil ditulis ke ringkasan.csv.
+    Dengan `imputer`, laporan menyebut median yang menggantikan nilai hilang.
+    """
+    waktu = waktu or datetime.now()
+    data = scored[FEATURE_COLUMNS].to_numpy(dtype=float)
+    imputed = impute_array(data, imputer)[0] if imputer is not None else None
+    hasil = scored['Hasil'].to_numpy()
+    confidence = scored['Confidence'].to_numpy()
+    width = len(str(len(scored)))
+    with zipfile.ZipFile(fileobj, 'w', compression=zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr('ringkasan.csv', scored.to_csv(index_label='Pasien'))
+        for i in range(len(scored)):
+            record = {'data': data[i], 'hasil': hasil[i], 'confidence': confidence[i], 'waktu': waktu,
+                      'imputed': imputed[i] if imputed is not None else None}
+            for fmt in formats:
+                zf.writestr(f"pasien_{i + 1:0{width}d}.{fmt}", RENDERERS[fmt](record))
+    return fileobj
+
+
+def reports_zip(scored, formats=('txt', 'csv', 'html'), imputer=None):
+    """Arsip zip laporan sebagai bytes, untuk data st.download_button."""
+    buffer = io.BytesIO()
+    write_reports_zip(buffer, scored, formats, imputer=imputer)
+    return buffer.getvalue()
@@ -0,0 +1,104 @@
+import threading
+from typing import NamedTuple
+
+import numpy as np
+import pandas as pd
+
+from preprocessing import FEATURE_COLUMNS, fit_imputer, impute, mask_missing, missing_report
+
+
+class ReferenceData(NamedTuple):
+    """Dataset referensi dan agregatnya; dibagikan ke semua sesi dan hanya dibaca."""
+    raw: pd.DataFrame
+    imputed: pd.DataFrame
+    missing: pd.DataFrame
+    imputer: dict
+    corr: pd.DataFrame
+
+
+def build_reference(path="diabetes.csv"):
+    df = pd.read_csv(path)
+    imputer = fit_imputer(df)
+    imputed = impute(df, imputer)
+    # Korelasi dihitung dari pasangan nilai yang tersedia; imputasi per Outcome
+    # akan membocorkan target ke dalam korelasi
+    corr = mask_missing(df).corr()
+    return ReferenceData(df, imputed, missing_report(df), imputer, corr)
+
+
+class PredictionLog:
+    """Log prediksi append-only untuk seluruh sesi dalam satu proses.
+
+    Baris disimpan dalam ring buffer numpy berkapasitas tetap: bila penuh,
+    prediksi tertua ditimpa sehingga memori tidak bertambah seiring volume
+    prediksi. Agregat (total, positif, rata-rata keyakinan) dihitung secara
+    berjalan dan mencakup seluruh prediksi, termasuk yang sudah ditimpa.
+    """
+
+    def __init__(self, capacity=10000):
+        if capacity < 1:
+            raise ValueError("capacity minimal 1")
+        self.capacity = capacity
+        self._features = np.empty((capacity, len(FEATURE_COLUMNS)), dtype=float)
+        self._hasil = np.empty(capacity, dtype=np.int8)
+        self._confidence = np.empty(capacity, dtype=np.float32)
+        self._waktu = np.empty(capacity, dtype='datetime64[s]')
+        self._session = np.empty(capacity, dtype=np.int32)
+        self._total = 0
+        self._positif = 0
+        self._confidence_sum = 0.0
+        self._sessions = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        """Jumlah baris yang masih tersimpan."""
+        return min(self._total, self.capacity)
+
+    @property
+    def sessions(self):
+        return self._sessions
+
+    def register_session(self):
+        with self._lock:
+            self._sessions += 1
+            return self._sessions
+
+    def append(self, features, hasil, confidence, waktu, session):
+        """Tambahkan satu batch prediksi (atau satu prediksi) sekaligus."""
+        features = np.atleast_2d(np.asarray(features, dtype=float))
+        hasil = np.broadcast_to(np.asarray(hasil, dtype=np.int8), len(features))
+        confidence = np.broadcast_to(np.asarray(confidence, dtype=np.float32), len(features))
+        # Bila batch lebih besar dari kapasitas, hanya bagian akhirnya yang tersimpan
+        keep = slice(max(len(features) - self.capacity, 0), None)
+        with self._lock:
+            idx = (self._total + np.arange(len(features))[keep]) % self.capacity
+            self._features[idx] = features[keep]
+            self._hasil[idx] = hasil[keep]
+            self._confidence[idx] = confidence[keep]
+            self._waktu[idx] = np.datetime64(waktu, 's')
+            self._session[idx] = session
+            self._total += len(features)
+            self._positif += int(hasil.sum())
+            self._confidence_sum += float(confidence.sum())
+
+    def tail(self, n=100):
+        """`n` prediksi terbaru (terbaru di atas); hanya baris tersebut yang disalin."""
+        with self._lock:
+            n = min(n, self._total, self.capacity)
+            idx = np.arange(self._total - 1, self._total - 1 - n, -1) % self.capacity
+            df = pd.DataFrame(self._features[idx], columns=FEATURE_COLUMNS)
+            df['Hasil'] = self._hasil[idx]
+            df['Confidence'] = self._confidence[idx]
+            df['Waktu'] = self._waktu[idx]
+            df['Sesi'] = self._session[idx]
+        return df
+
+    def summary(self):
+        """Agregat seluruh prediksi."""
+        with self._lock:
+            n = self._total
+            positif = self._positif
+            confidence = self._confidence_sum / n if n else 0.0
+            sessions = self._sessions
+        return {'total': n, 'positif': positif, 'negatif': n - positif,
+                'confidence_rata2': confidence, 'sesi': sessions}
@@ -2,9 +2,17 @@ import streamlit as st
 import pandas as pd
 import numpy as np
 import pickle
+import io
+import os
+import hmac
 import plotly.express as px
 import plotly.graph_objects as go
 from datetime import datetime
+from functools import partial
+from preprocessing import FEATURE_COLUMNS, ZERO_MISSING_COLUMNS, impute_array
+from drift import DriftMonitor
+from store import PredictionLog, build_reference
+from reports import PARAMETER_LABELS, analisis_parameter, parameter_values, render_csv, render_txt, reports_zip, score_batch
 
 # Konfigurasi halaman
 st.set_page_config(
@@ -14,11 +22,21 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Inisialisasi session state
-if 'last_prediction' not in st.session_state:
-    st.session_state.last_prediction = None
-if 'predictions_history' not in st.session_state:
-    st.session_state.predictions_history = []
+@st.cache_resource
+def load_prediction_log():
+    # Log prediksi bersama untuk semua sesi, dengan kapasitas tetap
+    nilai = os.environ.get("DIABETES_LOG_CAPACITY", "10000")
+    capacity = int(nilai) if nilai.strip().isdigit() else 0
+    if capacity < 1:
+        st.warning(f"DIABETES_LOG_CAPACITY tidak valid ({nilai!r}); memakai kapasitas bawaan 10000.")
+        capacity = 10000
+    return PredictionLog(capacity=capacity)
+
+prediction_log = load_prediction_log()
+
+# Inisialisasi session state (hanya nomor sesi; prediksi ada di log bersama)
+if 'session_no' not in st.session_state:
+    st.session_state.session_no = prediction_log.register_session()
 
 @st.cache_resource
 def load_model():
@@ -33,8 +51,67 @@ def load_model():
         st.sidebar.error(f"Error loading model: {str(e)}")
         return None, False
 
+@st.cache_resource
+def load_reference():
+    # Satu salinan dataset (mentah & imputasi) beserta agregatnya untuk semua sesi.
+    # Jangan ubah DataFrame hasil fungsi ini secara in-place.
+    return build_reference("diabetes.csv")
+
+def load_imputer():
+    try:
+        return load_reference().imputer
+    except Exception:
+        return None
+
+@st.cache_resource
+def load_drift_monitor(_model):
+    # Satu monitor untuk seluruh sesi; distribusi referensi dari diabetes.csv,
+    # diimputasi dengan cara yang sama seperti input saat prediksi
+    try:
+        reference = load_reference()
+    except Exception:
+        return None
+    X, _ = impute_array(reference.raw[FEATURE_COLUMNS].to_numpy(), reference.imputer)
+    distributions = {col: X[:, i] for i, col in enumerate(FEATURE_COLUMNS)}
+    if _model is not None and hasattr(_model, 'decision_function'):
+        distributions['DecisionScore'] = _model.decision_function(X)
+    return DriftMonitor(distributions)
+
+def is_admin():
+    # Fitur admin hanya aktif bila DIABETES_ADMIN_PASSWORD di-set di server
+    password = os.environ.get("DIABETES_ADMIN_PASSWORD")
+    if not password:
+        st.caption("Fitur admin tidak aktif (DIABETES_ADMIN_PASSWORD belum di-set).")
+        return False
+    if not st.session_state.get('is_admin'):
+        masukan = st.text_input("Kata Sandi Admin", type="password", key="admin_password")
+        st.session_state.is_admin = bool(masukan) and hmac.compare_digest(masukan.encode(), password.encode())
+        if masukan and not st.session_state.is_admin:
+            st.error("Kata sandi salah.")
+    return st.session_state.is_admin
+
 # Load model
 model_diabetes, model_loaded = load_model()
+drift_monitor = load_drift_monitor(model_diabetes)
+
+@st.cache_data(max_entries=16)
+def score_uploaded(data):
+    # Hasil prediksi berkas di-cache berdasarkan isi berkas
+    return score_batch(pd.read_csv(io.BytesIO(data)), model_diabetes, load_imputer())
+
+def record_batch(scored):
+    # Catat prediksi berkas ke log bersama dan monitor drift
+    X = scored[FEATURE_COLUMNS].to_numpy(dtype=float)
+    prediction_log.append(X, scored['Hasil'].to_numpy(), scored['Confidence'].to_numpy(),
+                          datetime.now(), st.session_state.session_no)
+    if drift_monitor is not None:
+        imputer = load_imputer()
+        if imputer is not None:
+            X, _ = impute_array(X, imputer)
+        batch = {col: X[:, i] for i, col in enumerate(FEATURE_COLUMNS)}
+        if 'DecisionScore' in scored:
+            batch['DecisionScore'] = scored['DecisionScore'].to_numpy()
+        drift_monitor.update(batch)
 
 # CSS kustom
 st.markdown("""
@@ -84,6 +161,10 @@ st.markdown("""
         border-left-color: #dc3545;
         background: #f8d7da;
     }
+    .param-missing {
+        border-left-color: #6c757d;
+        background: #e9ecef;
+    }
     .confidence-meter {
         height: 20px;
         background: #e9ecef;
@@ -109,9 +190,13 @@ with st.sidebar:
     st.image("https://img.icons8.com/color/96/000000/diabetes.png", width=100)
     st.title("Navigasi")
     
+    # Menu monitoring hanya muncul bila akses admin dikonfigurasi
+    pilihan_menu = ["🏠 Beranda", "📊 Prediksi", "📈 Analisis", "📋 Data", "ℹ️ Tentang"]
+    if os.environ.get("DIABETES_ADMIN_PASSWORD"):
+        pilihan_menu.insert(4, "🛡️ Monitoring")
     menu = st.radio(
         "Pilih Menu:",
-        ["🏠 Beranda", "📊 Prediksi", "📈 Analisis", "📋 Data", "ℹ️ Tentang"]
+        pilihan_menu
     )
     
     st.markdown("---")
@@ -164,7 +249,7 @@ if menu == "🏠 Beranda":
 elif menu == "📊 Prediksi":
     st.header("🔍 Prediksi Risiko Diabetes")
     
-    tab1, tab2 = st.tabs(["📝 Input Data", "⚡ Input Cepat"])
+    tab1, tab2, tab3 = st.tabs(["📝 Input Data", "⚡ Input Cepat", "📁 Prediksi Berkas"])
     
     # Inisialisasi variabel dengan default values di session state
     if 'input_values' not in st.session_state:
@@ -265,6 +350,45 @@ elif menu == "📊 Prediksi":
         })
         st.dataframe(data_contoh, use_container_width=True)
     
+    with tab3:
+        st.write("Unggah berkas CSV dengan kolom: " + ", ".join(f"`{c}`" for c in FEATURE_COLUMNS))
+        berkas = st.file_uploader("Berkas CSV Pasien", type="csv", key="batch_upload")
+        
+        if berkas is not None:
+            if model_loaded and model_diabetes is not None:
+                try:
+                    # Prediksi seluruh pasien sekaligus (sekali per berkas)
+                    scored_df = score_uploaded(berkas.getvalue())
+                    if st.session_state.get('batch_recorded') != berkas.file_id:
+                        record_batch(scored_df)
+                        st.session_state.batch_recorded = berkas.file_id
+                    
+                    col_batch1, col_batch2 = st.columns(2)
+                    with col_batch1:
+                        st.metric("Jumlah Pasien", len(scored_df))
+                    with col_batch2:
+                        st.metric("Risiko Tinggi", int(scored_df['Hasil'].sum()))
+                    st.dataframe(scored_df, use_container_width=True)
+                    
+                    # Laporan per pasien dibuat saat tombol diklik
+                    format_laporan = st.multiselect("Format Laporan:", ['txt', 'csv', 'html'],
+                                                    default=['txt', 'csv'], key="batch_formats")
+                    st.download_button(
+                        label="📦 Download Laporan Pasien (ZIP)",
+                        data=partial(reports_zip, scored_df, tuple(format_laporan), load_imputer()),
+                        file_name=f"laporan_prediksi_{datetime.now().strftime('%Y%m%d_%H%M%S')}.zip",
+                        mime="application/zip",
+                        on_click="ignore",
+                        disabled=not format_laporan,
+                        key="download_zip"
+                    )
+                except KeyError as e:
+                    st.error(f"Kolom tidak ditemukan pada berkas: {str(e)}")
+                except Exception as e:
+                    st.error(f"Error memproses berkas: {str(e)}")
+            else:
+                st.error("Model tidak tersedia. Pastikan file 'diabetes_model.sav' ada di server.")
+    
     st.markdown("---")
     
     # Tombol prediksi
@@ -279,10 +403,19 @@ elif menu == "📊 Prediksi":
             data_input = np.array([[kehamilan, glukosa, tekanan_darah, ketebalan_kulit,
                                    insulin, bmi, riwayat_diabetes, usia]])
             
+            # Isi nilai 0 (nilai hilang) dengan median dataset
+            imputer = load_imputer()
+            if imputer is not None:
+                data_input, missing_mask = impute_array(data_input, imputer)
+                if missing_mask.any():
+                    kolom_hilang = [c for c, m in zip(ZERO_MISSING_COLUMNS, missing_mask[0]) if m]
+                    st.info(f"Nilai 0 pada {', '.join(kolom_hilang)} dianggap tidak tersedia dan diisi dengan median dataset.")
+            
             # Lakukan prediksi
             hasil_prediksi = model_diabetes.predict(data_input)[0]
             
             # Untuk SVM dengan probability=False, gunakan decision function untuk confidence
+            decision_score = None
             try:
                 if hasattr(model_diabetes, 'decision_function'):
                     decision_score = model_diabetes.decision_function(data_input)[0]
@@ -297,19 +430,24 @@ elif menu == "📊 Prediksi":
                 confidence = 85.0
                 confidence_label = "85.0%"
             
-            # Simpan ke session state
-            st.session_state.last_prediction = {
+            # Catat input dan skor untuk monitoring drift
+            if drift_monitor is not None:
+                batch = {col: data_input[:, i] for i, col in enumerate(FEATURE_COLUMNS)}
+                if decision_score is not None:
+                    batch['DecisionScore'] = [decision_score]
+                drift_monitor.update(batch)
+            
+            # Simpan ke log bersama
+            record = {
                 'data': [kehamilan, glukosa, tekanan_darah, ketebalan_kulit,
-                        insulin, bmi, riwayat_diabetes, usia],
-                'hasil': hasil_prediksi,
+                         insulin, bmi, riwayat_diabetes, usia],
+                'hasil': int(hasil_prediksi),
                 'confidence': confidence,
-                'confidence_label': confidence_label,
-                'waktu': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                'model': "Support Vector Machine (SVM)"
+                'waktu': datetime.now(),
+                'imputed': data_input[0].tolist() if imputer is not None else None
             }
-            
-            # Tambahkan ke history
-            st.session_state.predictions_history.append(st.session_state.last_prediction.copy())
+            prediction_log.append(record['data'], record['hasil'], record['confidence'],
+                                  record['waktu'], st.session_state.session_no)
             
             # Tampilkan animasi
             st.balloons()
@@ -377,105 +515,20 @@ elif menu == "📊 Prediksi":
             # ===== ANALISIS PARAMETER =====
             st.subheader("📊 Analisis Parameter")
             
-            # Buat DataFrame untuk analisis parameter
-            param_data = {
-                'Parameter': ['Kehamilan', 'Glukosa', 'Tekanan Darah', 'Ketebalan Kulit', 
-                            'Insulin', 'BMI', 'Riwayat Diabetes', 'Usia'],
-                'Nilai': [kehamilan, glukosa, tekanan_darah, ketebalan_kulit, 
-                         insulin, bmi, riwayat_diabetes, usia],
-                'Status': ['Normal'] * 8,
-                'Kategori': ['Normal'] * 8
-            }
-            
-            # Analisis Glukosa
-            if glukosa >= 126:
-                param_data['Status'][1] = 'danger'
-                param_data['Kategori'][1] = 'Tinggi (≥126 mg/dL)'
-                glukosa_class = "param-danger"
-                glukosa_msg = f"❌ **Glukosa tinggi** ({glukosa} mg/dL) - Di atas batas diabetes (≥126 mg/dL)"
-            elif glukosa >= 100:
-                param_data['Status'][1] = 'warning'
-                param_data['Kategori'][1] = 'Pra-diabetes (100-125 mg/dL)'
-                glukosa_class = "param-warning"
-                glukosa_msg = f"⚠️ **Glukosa perbatasan** ({glukosa} mg/dL) - Pra-diabetes"
-            else:
-                param_data['Status'][1] = 'good'
-                param_data['Kategori'][1] = 'Normal (<100 mg/dL)'
-                glukosa_class = "param-good"
-                glukosa_msg = f"✅ **Glukosa normal** ({glukosa} mg/dL)"
-            
-            # Analisis BMI
-            if bmi >= 30:
-                param_data['Status'][5] = 'danger'
-                param_data['Kategori'][5] = 'Obesitas (≥30)'
-                bmi_class = "param-danger"
-                bmi_msg = f"❌ **BMI obesitas** ({bmi}) - Faktor risiko tinggi"
-            elif bmi >= 25:
-                param_data['Status'][5] = 'warning'
-                param_data['Kategori'][5] = 'Overweight (25-29.9)'
-                bmi_class = "param-warning"
-                bmi_msg = f"⚠️ **BMI overweight** ({bmi}) - Perlu penurunan berat badan"
-            else:
-                param_data['Status'][5] = 'good'
-                param_data['Kategori'][5] = 'Normal (18.5-24.9)'
-                bmi_class = "param-good"
-                bmi_msg = f"✅ **BMI normal** ({bmi})"
-            
-            # Analisis Tekanan Darah
-            if tekanan_darah >= 140:
-                param_data['Status'][2] = 'danger'
-                param_data['Kategori'][2] = 'Hipertensi (≥140 mmHg)'
-                tekanan_class = "param-danger"
-                tekanan_msg = f"❌ **Tekanan darah tinggi** ({tekanan_darah} mmHg) - Hipertensi"
-            elif tekanan_darah >= 130:
-                param_data['Status'][2] = 'warning'
-                param_data['Kategori'][2] = 'Pra-hipertensi (130-139 mmHg)'
-                tekanan_class = "param-warning"
-                tekanan_msg = f"⚠️ **Tekanan darah perbatasan** ({tekanan_darah} mmHg) - Perlu pemantauan"
-            else:
-                param_data['Status'][2] = 'good'
-                param_data['Kategori'][2] = 'Normal (<130 mmHg)'
-                tekanan_class = "param-good"
-                tekanan_msg = f"✅ **Tekanan darah normal** ({tekanan_darah} mmHg)"
-            
-            # Analisis Usia
-            if usia >= 45:
-                param_data['Status'][7] = 'warning'
-                param_data['Kategori'][7] = 'Risiko Tinggi (≥45 tahun)'
-                usia_class = "param-warning"
-                usia_msg = f"⚠️ **Usia ≥45 tahun** ({usia} tahun) - Faktor risiko diabetes meningkat"
-            else:
-                param_data['Status'][7] = 'good'
-                param_data['Kategori'][7] = 'Normal (<45 tahun)'
-                usia_class = "param-good"
-                usia_msg = f"✅ **Usia <45 tahun** ({usia} tahun) - Risiko lebih rendah"
-            
-            # Analisis Insulin
-            if insulin > 100:
-                param_data['Status'][4] = 'warning'
-                param_data['Kategori'][4] = 'Tinggi (>100 μU/mL)'
-                insulin_class = "param-warning"
-                insulin_msg = f"⚠️ **Insulin tinggi** ({insulin} μU/mL) - Kemungkinan resistensi insulin"
-            elif insulin < 25:
-                param_data['Status'][4] = 'warning'
-                param_data['Kategori'][4] = 'Rendah (<25 μU/mL)'
-                insulin_class = "param-warning"
-                insulin_msg = f"⚠️ **Insulin rendah** ({insulin} μU/mL) - Perlu evaluasi fungsi pankreas"
-            else:
-                param_data['Status'][4] = 'good'
-                param_data['Kategori'][4] = 'Normal (25-100 μU/mL)'
-                insulin_class = "param-good"
-                insulin_msg = f"✅ **Insulin normal** ({insulin} μU/mL)"
+            # Analisis parameter dari record prediksi
+            analisis = analisis_parameter(record['data'], record['imputed'])
             
             # Tampilkan analisis per parameter
-            st.markdown(f'<div class="param-analysis {glukosa_class}">{glukosa_msg}</div>', unsafe_allow_html=True)
-            st.markdown(f'<div class="param-analysis {bmi_class}">{bmi_msg}</div>', unsafe_allow_html=True)
-            st.markdown(f'<div class="param-analysis {tekanan_class}">{tekanan_msg}</div>', unsafe_allow_html=True)
-            st.markdown(f'<div class="param-analysis {usia_class}">{usia_msg}</div>', unsafe_allow_html=True)
-            st.markdown(f'<div class="param-analysis {insulin_class}">{insulin_msg}</div>', unsafe_allow_html=True)
+            for param_class, param_msg in analisis['pesan']:
+                st.markdown(f'<div class="param-analysis {param_class}">{param_msg}</div>', unsafe_allow_html=True)
             
             # Tampilkan tabel parameter
-            param_df = pd.DataFrame(param_data)
+            param_df = pd.DataFrame({
+                'Parameter': PARAMETER_LABELS,
+                'Nilai': parameter_values(record['data']),
+                'Status': analisis['status'],
+                'Kategori': analisis['kategori']
+            })
             st.subheader("📋 Tabel Parameter Pasien")
             st.dataframe(param_df, use_container_width=True)
             
@@ -484,63 +537,31 @@ elif menu == "📊 Prediksi":
             
             # Bar chart untuk parameter
             fig_bar = px.bar(param_df, x='Parameter', y='Nilai', color='Status',
-                           color_discrete_map={'good': 'green', 'warning': 'orange', 'danger': 'red'},
+                           color_discrete_map={'good': 'green', 'warning': 'orange', 'danger': 'red', 'missing': 'gray'},
                            title="Nilai Parameter Kesehatan",
                            hover_data=['Kategori'])
             st.plotly_chart(fig_bar, use_container_width=True)
             
-            # Tombol download hasil
+            # Tombol download hasil (laporan dibuat saat tombol diklik)
             st.subheader("💾 Simpan Hasil")
-            hasil_text = f"""HASIL PREDIKSI DIABETES
-Tanggal: {datetime.now().strftime("%d/%m/%Y %H:%M")}
-Model yang digunakan: Support Vector Machine (SVM)
-Tingkat Keyakinan: {confidence_label}
-
-DATA PASIEN:
-- Kehamilan: {kehamilan}
-- Glukosa: {glukosa} mg/dL
-- Tekanan Darah: {tekanan_darah} mm Hg
-- Ketebalan Kulit: {ketebalan_kulit} mm
-- Insulin: {insulin} mu U/ml
-- BMI: {bmi}
-- Riwayat Diabetes: {riwayat_diabetes}
-- Usia: {usia} tahun
-
-HASIL: {'RISIKO DIABETES TINGGI' if hasil_prediksi == 1 else 'RISIKO DIABETES RENDAH'}
-
-ANALISIS PARAMETER:
-1. {glukosa_msg}
-2. {bmi_msg}
-3. {tekanan_msg}
-4. {usia_msg}
-5. {insulin_msg}
-
-Catatan: Hasil ini merupakan prediksi berdasarkan model AI (SVM Classifier). 
-Konsultasi dengan dokter tetap diperlukan untuk diagnosis pasti.
-"""
-            
+            waktu_file = record['waktu'].strftime('%Y%m%d_%H%M%S')
             col_dl1, col_dl2 = st.columns(2)
             with col_dl1:
                 st.download_button(
                     label="📥 Download Hasil Prediksi",
-                    data=hasil_text,
-                    file_name=f"hasil_prediksi_diabetes_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt",
+                    data=partial(render_txt, record),
+                    file_name=f"hasil_prediksi_diabetes_{waktu_file}.txt",
                     mime="text/plain",
+                    on_click="ignore",
                     key="download_txt"
                 )
             with col_dl2:
-                # Simpan data ke CSV
-                hasil_df = pd.DataFrame({
-                    'Parameter': param_data['Parameter'],
-                    'Nilai': param_data['Nilai'],
-                    'Kategori': param_data['Kategori']
-                })
-                csv = hasil_df.to_csv(index=False)
                 st.download_button(
                     label="📊 Download Data CSV",
-                    data=csv,
-                    file_name=f"data_pasien_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
+                    data=partial(render_csv, record),
+                    file_name=f"data_pasien_{waktu_file}.csv",
                     mime="text/csv",
+                    on_click="ignore",
                     key="download_csv"
                 )
                 
@@ -552,8 +573,14 @@ elif menu == "📈 Analisis":
     st.header("📈 Analisis Data Diabetes")
     
     try:
-        # Load data
-        df = pd.read_csv("diabetes.csv")
+        # Load data (nilai 0 yang hilang sudah diisi median per Outcome)
+        reference = load_reference()
+        df, missing_df = reference.imputed, reference.missing
+        
+        with st.expander("🩹 Nilai Hilang pada Dataset"):
+            st.write("Nilai 0 pada kolom berikut dianggap hilang. Grafik distribusi memakai median per kelompok Outcome, "
+                     "sedangkan korelasi dihitung hanya dari pasangan nilai yang tersedia:")
+            st.dataframe(missing_df, use_container_width=True)
         
         # Ubah nama kolom
         df_indonesia = df.rename(columns={
@@ -599,7 +626,7 @@ elif menu == "📈 Analisis":
         
         with tab2:
             # Heatmap korelasi
-            fig = px.imshow(df.corr(),
+            fig = px.imshow(reference.corr,
                            title='Korelasi Antar Parameter',
                            color_continuous_scale='RdBu',
                            text_auto=True)
@@ -638,11 +665,19 @@ elif menu == "📋 Data":
     st.header("📋 Dataset Diabetes")
     
     try:
-        df = pd.read_csv("diabetes.csv")
+        reference = load_reference()
+        missing_df = reference.missing
+        
+        gunakan_imputasi = st.checkbox("Isi nilai hilang (0) dengan median per Outcome", value=False, key="use_imputed")
+        df = reference.imputed if gunakan_imputasi else reference.raw
         
         # Tampilkan data
         st.dataframe(df, use_container_width=True, height=400)
         
+        # Laporan nilai hilang
+        st.subheader("🩹 Nilai Hilang")
+        st.dataframe(missing_df, use_container_width=True)
+        
         # Statistik
         st.subheader("📊 Statistik Dataset")
         col_stat1, col_stat2, col_stat3 = st.columns(3)
@@ -684,7 +719,7 @@ elif menu == "📋 Data":
                 st.download_button(
                     label="Download CSV",
                     data=csv,
-                    file_name="diabetes_dataset.csv",
+                    file_name="diabetes_dataset_imputed.csv" if gunakan_imputasi else "diabetes_dataset.csv",
                     mime="text/csv",
                     key="dl_all"
                 )
@@ -694,6 +729,76 @@ elif menu == "📋 Data":
     except Exception as e:
         st.error(f"Error loading data: {str(e)}")
 
+# ==================== HALAMAN MONITORING ====================
+elif menu == "🛡️ Monitoring":
+    st.header("🛡️ Monitoring Drift Data")
+    
+    # Seluruh halaman memuat data semua sesi, sehingga hanya untuk admin
+    if not is_admin():
+        st.info("Masukkan kata sandi admin untuk membuka halaman monitoring.")
+    else:
+        if drift_monitor is None:
+            st.error("File 'diabetes.csv' tidak ditemukan. Distribusi referensi tidak tersedia.")
+        else:
+            st.write("""
+            Halaman ini membandingkan distribusi data pasien yang diprediksi dengan data referensi 
+            (`diabetes.csv`) menggunakan **PSI** (Population Stability Index) dan statistik **KS**.
+            """)
+        
+            report_df = drift_monitor.report()
+        
+            col_mon1, col_mon2, col_mon3 = st.columns(3)
+            with col_mon1:
+                st.metric("Total Prediksi Tercatat", drift_monitor.n)
+            with col_mon2:
+                st.metric("Fitur Drift Signifikan", int((report_df['Status'] == 'Drift signifikan').sum()))
+            with col_mon3:
+                psi_max = report_df['PSI'].max()
+                st.metric("PSI Maksimum", "–" if pd.isna(psi_max) else f"{psi_max:.3f}")
+        
+            # Peringatan drift
+            for _, row in report_df.iterrows():
+                if row['Status'] == 'Drift signifikan':
+                    st.error(f"🚨 **{row['Fitur']}**: drift signifikan (PSI {row['PSI']:.3f}, KS {row['KS']:.3f})")
+                elif row['Status'] == 'Drift sedang':
+                    st.warning(f"⚠️ **{row['Fitur']}**: drift sedang (PSI {row['PSI']:.3f}, KS {row['KS']:.3f})")
+            if (report_df['Status'] == 'Data kurang').all():
+                st.info("Belum cukup prediksi untuk menilai drift.")
+        
+            st.subheader("📋 Ringkasan Drift per Fitur")
+            st.dataframe(report_df, use_container_width=True)
+        
+            # Perbandingan distribusi
+            st.subheader("📊 Perbandingan Distribusi")
+            fitur_drift = st.selectbox("Pilih Fitur:", drift_monitor.names, key="drift_feature")
+            dist_df = drift_monitor.distribution(fitur_drift).melt(id_vars='Bin', var_name='Sumber', value_name='Proporsi')
+            fig = px.bar(dist_df, x='Bin', y='Proporsi', color='Sumber', barmode='group',
+                         title=f'Distribusi {fitur_drift}: Referensi vs Terbaru')
+            st.plotly_chart(fig, use_container_width=True)
+    
+        # Ringkasan prediksi dari semua sesi
+        st.markdown("---")
+        st.subheader("👥 Prediksi Semua Sesi")
+        ringkasan = prediction_log.summary()
+        col_sum1, col_sum2, col_sum3, col_sum4 = st.columns(4)
+        with col_sum1:
+            st.metric("Total Prediksi", ringkasan['total'])
+        with col_sum2:
+            st.metric("Risiko Tinggi", ringkasan['positif'])
+        with col_sum3:
+            st.metric("Rata-rata Keyakinan", f"{ringkasan['confidence_rata2']:.1f}%")
+        with col_sum4:
+            st.metric("Total Sesi (sejak server mulai)", ringkasan['sesi'])
+    
+        # Data per pasien dan reset monitoring (berlaku untuk semua sesi)
+        with st.expander("🗂️ Data Prediksi & Reset"):
+            if ringkasan['total'] > 0:
+                st.write("**Prediksi Terbaru:**")
+                st.dataframe(prediction_log.tail(100), use_container_width=True)
+            if drift_monitor is not None and st.button("🔄 Reset Monitoring", key="reset_drift"):
+                drift_monitor.reset()
+                st.rerun()
+
 # ==================== HALAMAN TENTANG ====================
 elif menu == "ℹ️ Tentang":
     st.header("ℹ️ Tentang Aplikasi")
@@ -0,0 +1,65 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+from drift import MIN_SAMPLES, DriftMonitor, ks_statistic, population_stability_index
+from preprocessing import FEATURE_COLUMNS, fit_imputer, impute_array
+
+DATASET = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "diabetes.csv")
+
+
+def test_psi_and_ks_identical_histograms():
+    counts = [10, 20, 30, 40]
+    assert population_stability_index(counts, counts) == 0.0
+    assert ks_statistic(counts, counts) == 0.0
+
+
+def test_psi_and_ks_shifted_histograms():
+    expected = [40, 30, 20, 10]
+    actual = [10, 20, 30, 40]
+    assert population_stability_index(expected, actual) > 0.25
+    assert np.isclose(ks_statistic(expected, actual), 0.4)
+
+
+def test_exponential_decay():
+    monitor = DriftMonitor({'x': np.arange(100)}, half_life=10)
+    monitor.update({'x': np.full(10, 5.0)})
+    assert np.isclose(monitor.counts['x'].sum(), 10)
+    # Setelah `half_life` prediksi berikutnya, bobot batch pertama tinggal separuh
+    monitor.update({'x': np.full(10, 95.0)})
+    first_bin = monitor._histogram('x', [5.0]).argmax()
+    assert np.isclose(monitor.counts['x'][first_bin], 5)
+    assert np.isclose(monitor.counts['x'].sum(), 15)
+    assert monitor.n == 20
+
+
+def test_min_samples_gate():
+    monitor = DriftMonitor({'x': np.arange(100)})
+    monitor.update({'x': np.full(MIN_SAMPLES - 1, 99.0)})
+    row = monitor.report().iloc[0]
+    assert row['Status'] == 'Data kurang'
+    assert np.isnan(row['PSI']) and np.isnan(row['KS'])
+
+    monitor.update({'x': np.full(5, 99.0)})
+    assert monitor.report().iloc[0]['Status'] == 'Drift signifikan'
+
+
+def test_reset():
+    monitor = DriftMonitor({'x': np.arange(100)})
+    monitor.update({'x': np.arange(50)})
+    monitor.reset()
+    assert monitor.n == 0
+    assert monitor.counts['x'].sum() == 0
+    assert monitor.report().iloc[0]['Status'] == 'Data kurang'
+
+
+def test_replaying_reference_is_stable():
+    df = pd.read_csv(DATASET)
+    X, _ = impute_array(df[FEATURE_COLUMNS].to_numpy(), fit_imputer(df))
+    columns = {col: X[:, i] for i, col in enumerate(FEATURE_COLUMNS)}
+    monitor = DriftMonitor(columns, half_life=10**9)
+    monitor.update(columns)
+    report = monitor.report()
+    assert (report['Status'] == 'Stabil').all()
+    assert report['PSI'].max() < 0.01
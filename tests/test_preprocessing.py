@@ -0,0 +1,87 @@
+import io
+
+import numpy as np
+import pandas as pd
+
+from preprocessing import (FEATURE_COLUMNS, ZERO_MISSING_COLUMNS, detect_missing, fit_imputer,
+                           impute, impute_array, missing_report)
+
+
+def make_df():
+    return pd.DataFrame({
+        'Pregnancies': [1, 2, 3, 4],
+        'Glucose': [100, 0, 140, 160],
+        'BloodPressure': [70, 80, 0, 90],
+        'SkinThickness': [20, 0, 30, 0],
+        'Insulin': [0, 50, 150, 250],
+        'BMI': [25.0, 30.0, 0.0, 35.0],
+        'DiabetesPedigreeFunction': [0.3, 0.4, 0.5, 0.6],
+        'Age': [30, 40, 50, 60],
+        'Outcome': [0, 0, 1, 1],
+    })
+
+
+def test_detect_missing_counts_zero_and_nan():
+    df = make_df()
+    df.loc[0, 'Glucose'] = np.nan
+    mask = detect_missing(df)
+    assert list(mask.columns) == ZERO_MISSING_COLUMNS
+    assert mask['Glucose'].tolist() == [True, True, False, False]
+    # Kolom di luar ZERO_MISSING_COLUMNS tidak diperiksa
+    assert missing_report(df)['Jumlah Hilang'].tolist() == [2, 1, 2, 1, 1]
+
+
+def test_fit_imputer_ignores_missing_values():
+    imputer = fit_imputer(make_df())
+    assert imputer['global']['Glucose'] == 140
+    assert imputer['global']['SkinThickness'] == 25
+    assert imputer['by_outcome'].loc[0, 'Insulin'] == 50
+    assert imputer['by_outcome'].loc[1, 'Insulin'] == 200
+
+
+def test_impute_uses_outcome_median_with_global_fallback():
+    df = make_df()
+    imputed = impute(df)
+    # Median per Outcome
+    assert imputed.loc[0, 'Insulin'] == 50
+    assert imputed.loc[2, 'BloodPressure'] == 90
+    # Outcome 0 tidak punya Glucose yang tersedia selain 100
+    assert imputed.loc[1, 'Glucose'] == 100
+    # Outcome 1 tidak punya SkinThickness selain 30 sehingga median per Outcome dipakai;
+    # tanpa Outcome, median global yang dipakai
+    assert imputed.loc[3, 'SkinThickness'] == 30
+    no_outcome = impute(df.drop(columns='Outcome'), fit_imputer(df))
+    assert no_outcome.loc[3, 'SkinThickness'] == 25
+    assert not detect_missing(imputed).any().any()
+    # Data asli tidak berubah
+    assert df.loc[0, 'Insulin'] == 0
+
+
+def test_impute_falls_back_to_global_when_outcome_group_is_empty():
+    df = make_df()
+    df.loc[[2, 3], 'SkinThickness'] = 0
+    imputed = impute(df)
+    assert imputed.loc[3, 'SkinThickness'] == 20
+
+
+def test_impute_array_fills_zero_and_nan_with_global_median():
+    imputer = fit_imputer(make_df())
+    X = np.array([
+        [1, 0, 70, np.nan, 80, 0.0, 0.3, 30],
+        [2, 120, 75, 22, 90, 28.0, 0.4, 35],
+    ])
+    filled, mask = impute_array(X, imputer)
+    assert not np.isnan(filled).any()
+    assert filled[0, FEATURE_COLUMNS.index('Glucose')] == 140
+    assert filled[0, FEATURE_COLUMNS.index('SkinThickness')] == 25
+    assert filled[0, FEATURE_COLUMNS.index('BMI')] == 30
+    assert mask.tolist() == [[True, False, True, False, True], [False] * 5]
+    np.testing.assert_array_equal(filled[1], X[1])
+
+
+def test_impute_array_handles_blank_csv_cells():
+    df = pd.read_csv(io.StringIO(
+        ",".join(FEATURE_COLUMNS) + "\n1,120,,20,,30.1,0.5,40\n"))
+    filled, mask = impute_array(df[FEATURE_COLUMNS].to_numpy(), fit_imputer(make_df()))
+    assert not np.isnan(filled).any()
+    assert mask[0].tolist() == [False, True, False, True, False]
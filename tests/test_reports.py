@@ -0,0 +1,88 @@
+import io
+import zipfile
+
+import numpy as np
+import pandas as pd
+
+from preprocessing import FEATURE_COLUMNS
+from preprocessing import fit_imputer
+from reports import analisis_parameter, parameter_values, render_csv, reports_zip, score_batch
+
+
+class GlucoseModel:
+    """Model sederhana: positif bila glukosa >= 126."""
+
+    def decision_function(self, X):
+        return (X[:, 1] - 126) / 10
+
+    def predict(self, X):
+        return (self.decision_function(X) >= 0).astype(int)
+
+
+def make_scored():
+    df = pd.DataFrame([
+        [6, 148, 72, 35, 0, 33.6, 0.627, 50],
+        [1, 85, 66, 29, 0, 26.6, 0.351, 31],
+    ], columns=FEATURE_COLUMNS)
+    return score_batch(df, GlucoseModel())
+
+
+def test_score_batch():
+    scored = make_scored()
+    assert scored['Hasil'].tolist() == [1, 0]
+    assert np.allclose(scored['Confidence'], [72.0, 9.0])
+
+
+def test_parameter_values_keeps_fractions():
+    values = parameter_values([6, 148.7, 72.0, 35, 0, 33.6, 0.627, 50])
+    assert values[1] == 148.7
+    assert values[2] == 72 and isinstance(values[2], int)
+
+
+def test_reports_zip():
+    data = reports_zip(make_scored(), ('txt', 'csv', 'html'))
+    # st.download_button menerima bytes apa adanya
+    assert isinstance(data, bytes)
+    with zipfile.ZipFile(io.BytesIO(data)) as zf:
+        assert sorted(zf.namelist()) == [
+            'pasien_1.csv', 'pasien_1.html', 'pasien_1.txt',
+            'pasien_2.csv', 'pasien_2.html', 'pasien_2.txt',
+            'ringkasan.csv',
+        ]
+        assert 'RISIKO DIABETES TINGGI' in zf.read('pasien_1.txt').decode()
+        assert 'RISIKO DIABETES RENDAH' in zf.read('pasien_2.txt').decode()
+
+
+def test_analisis_parameter_missing_values():
+    data = [1, 0, 70, 0, 0, float('nan'), 0.3, 30]
+    imputed = [1, 117, 70, 29, 125, 32.3, 0.3, 30]
+    analisis = analisis_parameter(data, imputed)
+    assert analisis['status'] == ['Normal', 'missing', 'good', 'missing', 'missing', 'missing', 'Normal', 'good']
+    assert analisis['kategori'][1] == 'Tidak tersedia (diisi median 117 mg/dL)'
+    assert analisis['pesan'][0][0] == 'param-missing'
+    assert 'normal' not in analisis['pesan'][0][1].lower()
+    # Tekanan darah tersedia dan tetap dinilai
+    assert analisis['pesan'][2][0] == 'param-good'
+
+
+def test_render_csv_marks_missing():
+    record = {'data': [6, 0, 72, 35, 0, 33.6, 0.627, 50], 'hasil': 1, 'confidence': 90.0}
+    text = render_csv(record)
+    assert 'Glukosa,0,Tidak tersedia (diisi median dataset)' in text
+    assert 'Normal (<100 mg/dL)' not in text
+
+
+def test_reports_zip_flags_imputed_cells():
+    df = pd.DataFrame([
+        [6, 148, 72, 35, 0, 33.6, 0.627, 50],
+        [1, 85, 66, 29, 94, 26.6, 0.351, 31],
+        [8, 183, 64, 0, 0, np.nan, 0.672, 32],
+    ], columns=FEATURE_COLUMNS)
+    imputer = fit_imputer(df)
+    scored = score_batch(df, GlucoseModel(), imputer)
+    assert scored['Nilai Diisi'].tolist() == ['Insulin', '', 'SkinThickness, Insulin, BMI']
+
+    with zipfile.ZipFile(io.BytesIO(reports_zip(scored, ('txt',), imputer))) as zf:
+        ringkasan = pd.read_csv(io.BytesIO(zf.read('ringkasan.csv')), keep_default_na=False)
+        assert ringkasan['Nilai Diisi'].tolist() == ['Insulin', '', 'SkinThickness, Insulin, BMI']
+        assert 'Insulin tidak tersedia** - Nilai kosong/0, diisi median 94 mu U/ml' in zf.read('pasien_1.txt').decode()
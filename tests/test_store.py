@@ -0,0 +1,67 @@
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from store import PredictionLog
+
+WAKTU = datetime(2024, 1, 1, 12, 0)
+
+
+def features(start, n):
+    """Baris fitur dengan kolom pertama berisi nomor urut prediksi."""
+    X = np.zeros((n, 8))
+    X[:, 0] = np.arange(start, start + n)
+    return X
+
+
+def test_append_and_tail_newest_first():
+    log = PredictionLog(capacity=5)
+    log.append(features(0, 3), [1, 0, 1], [60, 70, 80], WAKTU, session=1)
+    assert len(log) == 3
+    tail = log.tail()
+    assert tail['Pregnancies'].tolist() == [2, 1, 0]
+    assert tail['Hasil'].tolist() == [1, 0, 1]
+    assert tail['Sesi'].tolist() == [1, 1, 1]
+
+
+def test_wraparound_keeps_latest_rows():
+    log = PredictionLog(capacity=5)
+    for i in range(8):
+        log.append(features(i, 1)[0], i % 2, 50.0, WAKTU, session=i)
+    assert len(log) == 5
+    assert log.tail()['Pregnancies'].tolist() == [7, 6, 5, 4, 3]
+    assert log.tail(2)['Sesi'].tolist() == [7, 6]
+
+
+def test_batch_larger_than_capacity():
+    log = PredictionLog(capacity=4)
+    log.append(features(0, 2), 0, 50.0, WAKTU, session=1)
+    log.append(features(2, 10), 1, 90.0, WAKTU, session=2)
+    assert len(log) == 4
+    assert log.tail()['Pregnancies'].tolist() == [11, 10, 9, 8]
+    # Batch berikutnya melanjutkan posisi ring buffer dengan benar
+    log.append(features(12, 1), 0, 50.0, WAKTU, session=3)
+    assert log.tail()['Pregnancies'].tolist() == [12, 11, 10, 9]
+
+
+def test_summary_counts_overwritten_rows():
+    log = PredictionLog(capacity=3)
+    log.append(features(0, 4), [1, 1, 0, 0], [100, 80, 60, 40], WAKTU, session=1)
+    log.append(features(4, 2), [1, 0], [70, 50], WAKTU, session=1)
+    summary = log.summary()
+    assert summary['total'] == 6
+    assert summary['positif'] == 3
+    assert summary['negatif'] == 3
+    assert summary['confidence_rata2'] == pytest.approx(400 / 6)
+
+
+def test_register_session():
+    log = PredictionLog()
+    assert [log.register_session() for _ in range(3)] == [1, 2, 3]
+    assert log.summary()['sesi'] == 3
+
+
+def test_invalid_capacity():
+    with pytest.raises(ValueError):
+        PredictionLog(capacity=0)